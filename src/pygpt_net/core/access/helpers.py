@@ -22,6 +22,20 @@ class Helpers:
         :param window: Window instance
         """
         self.window = window
+        self._dt = None  # cached date labels
+        self._dt_lang = None  # language of cached date labels
+        self._tpl = None  # cached message templates
+        self._tpl_lang = None  # language of cached message templates
+        self.templates = {
+            "status": ("event.audio.app.status", ("mode", "tab", "ctx", "last", "total")),
+            "ctx_current": ("event.audio.ctx.current", ("ctx", "last")),
+            "ctx_selected": ("event.audio.ctx.selected", ("ctx", "last")),
+            "tab_switch": ("event.audio.tab.switch", ("tab",)),
+            "mode_selected": ("event.audio.mode.selected", ("mode",)),
+            "model_selected": ("event.audio.model.selected", ("model",)),
+            "preset_selected": ("event.audio.preset.selected", ("preset",)),
+            "ctx_last": ("event.audio.ctx.last", ("input", "output")),
+        }
 
     def get_status(self) -> str:
         """
@@ -37,21 +51,16 @@ class Helpers:
         mode += " " + self.get_selected_preset()
         tab = self.window.controller.ui.get_current_tab_name()
         last = ""
-        msg = ""
         if meta is not None:
             ctx = meta.name
             last = self.convert_date(meta.updated)
-        try:
-            msg = trans("event.audio.app.status").format(
-                mode=mode,
-                tab=tab,
-                ctx=ctx,
-                last=last,
-                total=total,
-            )
-        except Exception as e:
-            pass
-        return msg
+        return self.get_tpl("status").format(
+            mode=mode,
+            tab=tab,
+            ctx=ctx,
+            last=last,
+            total=total,
+        )
 
     def get_current_ctx(self) -> str:
         """
@@ -61,16 +70,10 @@ class Helpers:
         """
         meta = self.window.core.ctx.get_current_meta()
         if meta is not None:
-            name = meta.name
-            updated = self.convert_date(meta.updated)
-            try:
-                msg = trans("event.audio.ctx.current").format(
-                    ctx=name,
-                    last=updated,
-                )
-            except Exception as e:
-                msg = ""
-            return msg
+            return self.get_tpl("ctx_current").format(
+                ctx=meta.name,
+                last=self.convert_date(meta.updated),
+            )
         return ""
 
     def get_selected_ctx(self) -> str:
@@ -81,16 +84,10 @@ class Helpers:
         """
         meta = self.window.core.ctx.get_current_meta()
         if meta is not None:
-            name = meta.name
-            updated = self.convert_date(meta.updated)
-            try:
-                msg = trans("event.audio.ctx.selected").format(
-                    ctx=name,
-                    last=updated,
-                )
-            except Exception as e:
-                msg = ""
-            return msg
+            return self.get_tpl("ctx_selected").format(
+                ctx=meta.name,
+                last=self.convert_date(meta.updated),
+            )
         return ""
 
     def get_selected_tab(self) -> str:
@@ -99,15 +96,10 @@ class Helpers:
 
         :return: text to read
         """
-        msg = ""
         tab = self.window.controller.ui.get_current_tab_name()
-        try:
-            msg = trans("event.audio.tab.switch").format(
-                tab=tab,
-            )
-        except Exception as e:
-            pass
-        return msg
+        return self.get_tpl("tab_switch").format(
+            tab=tab,
+        )
 
     def get_selected_mode(self) -> str:
         """
@@ -118,13 +110,9 @@ class Helpers:
         mode = self.window.core.config.get("mode")
         if mode is None:
             return ""
-        try:
-            msg = trans("event.audio.mode.selected").format(
-                mode=trans("mode." + mode),
-            )
-        except Exception as e:
-            msg = ""
-        return msg
+        return self.get_tpl("mode_selected").format(
+            mode=trans("mode." + mode),
+        )
 
     def get_selected_model(self) -> str:
         """
@@ -135,13 +123,9 @@ class Helpers:
         model = self.window.core.config.get("model")
         if model is None:
             return ""
-        try:
-            msg = trans("event.audio.model.selected").format(
-                model=model,
-            )
-        except Exception as e:
-            msg = ""
-        return msg
+        return self.get_tpl("model_selected").format(
+            model=model,
+        )
 
     def get_selected_preset(self) -> str:
         """
@@ -156,13 +140,9 @@ class Helpers:
         preset = self.window.core.presets.get_by_id(mode, preset_id)
         if preset is None:
             return ""
-        try:
-            msg = trans("event.audio.preset.selected").format(
-                preset=preset.name,
-            )
-        except Exception as e:
-            msg = ""
-        return msg
+        return self.get_tpl("preset_selected").format(
+            preset=preset.name,
+        )
 
     def get_last_ctx_item(self) -> str:
         """
@@ -170,17 +150,13 @@ class Helpers:
 
         :return: text to read
         """
-        text = ""
         item = self.window.core.ctx.get_last()
         if item is not None:
-            try:
-                text = trans("event.audio.ctx.last").format(
-                    input=item.input,
-                    output=item.output,
-                )
-            except Exception as e:
-                pass
-        return text
+            return self.get_tpl("ctx_last").format(
+                input=item.input,
+                output=item.output,
+            )
+        return ""
 
     def get_all_ctx_items(self) -> str:
         """
@@ -188,20 +164,60 @@ class Helpers:
 
         :return: text to read
         """
-        text = ""
-        entries = []
-        items = self.window.core.ctx.get_all_items(ignore_first=False)
-        for item in items:
-            try:
-                entries.append(trans("event.audio.ctx.last").format(
-                    input=item.input,
-                    output=item.output,
-                ))
-            except Exception as e:
-                pass
-        if len(entries) > 0:
-            text = "\n".join(entries)
-        return text
+        return "\n".join(self.iter_all_ctx_items())
+
+    def iter_all_ctx_items(self):
+        """
+        Iterate over all context items
+
+        :return: generator of texts to read
+        """
+        tpl = self.get_tpl("ctx_last")
+        for item in self.window.core.ctx.get_all_items(ignore_first=False):
+            yield tpl.format(
+                input=item.input,
+                output=item.output,
+            )
+
+    def get_tpl(self, name: str) -> str:
+        """
+        Get translated message template (cached until language changes)
+
+        :param name: template name
+        :return: template string, empty if translation is invalid
+        """
+        lang = self.window.core.config.get("lang")
+        if self._tpl is None or lang != self._tpl_lang:
+            self._tpl = {}
+            for k, (key, fields) in self.templates.items():
+                tpl = trans(key)
+                try:
+                    tpl.format(**dict.fromkeys(fields, ""))  # validate placeholders once
+                except Exception as e:
+                    self.window.core.debug.log(e)
+                    tpl = ""
+                self._tpl[k] = tpl
+            self._tpl_lang = lang
+        return self._tpl[name]
+
+    def get_dt_labels(self) -> dict:
+        """
+        Get translated date labels (cached until language changes)
+
+        :return: date labels dict
+        """
+        lang = self.window.core.config.get("lang")
+        if self._dt is None or lang != self._dt_lang:
+            self._dt = {k: trans("dt." + k) for k in (
+                "today",
+                "yesterday",
+                "week",
+                "weeks",
+                "days_ago",
+                "month",
+            )}
+            self._dt_lang = lang
+        return self._dt
 
     def convert_date(self, timestamp: int) -> str:
         """
@@ -212,23 +228,25 @@ class Helpers:
         """
         today = datetime.today().date()
         yesterday = today - timedelta(days=1)
-        date = datetime.fromtimestamp(timestamp).date()
-        hour_min = datetime.fromtimestamp(timestamp).strftime("%H:%M")
+        dt_obj = datetime.fromtimestamp(timestamp)
+        date = dt_obj.date()
+        hour_min = dt_obj.strftime("%H:%M")
 
+        dt = self.get_dt_labels()
         days_ago = (today - date).days
         weeks_ago = days_ago // 7
 
         if date == today:
-            return trans('dt.today') + " " + hour_min
+            return dt['today'] + " " + hour_min
         elif date == yesterday:
-            return trans('dt.yesterday') + " " + hour_min
+            return dt['yesterday'] + " " + hour_min
         elif weeks_ago == 1:
-            return trans('dt.week')
+            return dt['week']
         elif 1 < weeks_ago < 4:
-            return f"{weeks_ago} " + trans('dt.weeks')
+            return f"{weeks_ago} " + dt['weeks']
         elif days_ago < 30:
-            return f"{days_ago} " + trans('dt.days_ago')
+            return f"{days_ago} " + dt['days_ago']
         elif 30 <= days_ago < 32:
-            return trans('dt.month')
+            return dt['month']
         else:
             return date.strftime("%Y-%m-%d")
\ No newline at end of file
@@ -9,12 +9,54 @@
 # Updated Date: 2024.05.05 12:00:00                  #
 # ================================================== #
 
-import json
 import re
 
+try:
+    import orjson as _json  # faster parser, if available
+except ImportError:
+    import json as _json
+
 from pygpt_net.core.bridge import BridgeContext
 from .events import ControlEvent, AppEvent
 
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')  # structural chars for JSON objects scanner
+
+
+def _iter_json_objects(s: str):
+    """
+    Iterate over balanced JSON objects found in text (single linear pass)
+
+    Only structural characters are visited, the rest of the text is skipped by the regex engine.
+
+    :param s: text
+    :return: generator of JSON object substrings
+    """
+    depth = 0
+    start = 0
+    in_str = False
+    escaped = -1  # position of escaped char in string
+    for m in _JSON_TOKEN_RE.finditer(s):
+        i = m.start()
+        c = s[i]
+        if in_str:
+            if i == escaped:
+                continue
+            if c == '\\':
+                escaped = i + 1
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            if depth > 0:
+                in_str = True
+        elif c == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif c == '}' and depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield s[start:i + 1]
+
 
 class Voice:
     def __init__(self, window=None):
@@ -78,6 +120,7 @@ class Voice:
             ControlEvent.VOICE_MESSAGE_STOP: "Stop listening for voice input",
             ControlEvent.VOICE_MESSAGE_TOGGLE: "Toggle listening for voice input",
         }
+        self._command_keys = frozenset(self.commands)
         # events that should not be cached (dynamic data)
         self.cache_disabled_events = [
             ControlEvent.APP_STATUS,
@@ -94,6 +137,8 @@ class Voice:
             AppEvent.PRESET_SELECTED,
             AppEvent.TAB_SELECTED,  # notepad tabs can have custom names
         ]
+        self._prompt_prefix = None  # cached prompt prefix
+        self._prompt_prefix_key = None  # blacklist used to build cached prefix
 
     def get_commands(self) -> dict:
         """
@@ -101,11 +146,8 @@ class Voice:
 
         :return: commands
         """
-        cmds = {}
-        for k, v in self.commands.items():
-            if not self.is_blacklisted(k):
-                cmds[k] = v
-        return cmds
+        blacklist = set(self.get_blacklist_key())
+        return {k: v for k, v in self.commands.items() if k not in blacklist}
 
     def get_commands_string(self, values: bool = False) -> str:
         """
@@ -122,13 +164,16 @@ class Voice:
         else:
             return "\n".join([f"{k} = {v}" for k, v in self.get_commands().items()])
 
-    def get_prompt(self, text: str) -> str:
+    def get_prompt_prefix(self) -> str:
         """
-        Get prompt for voice command recognition
+        Get static part of voice command recognition prompt (cached until blacklist changes)
 
-        :param text: text to be spoken
-        :return: prompt
+        :return: prompt prefix
         """
+        key = self.get_blacklist_key()
+        if self._prompt_prefix is not None and key == self._prompt_prefix_key:
+            return self._prompt_prefix
+
         commands_str = self.get_commands_string()
         prompt = """
         Recognize the voice command and select the corresponding command from the list below. 
@@ -147,9 +192,19 @@ class Voice:
         
         User's voice input to recognize:
         
-        """+text
+        """
+        self._prompt_prefix = prompt.lstrip()
+        self._prompt_prefix_key = key
+        return self._prompt_prefix
 
-        return prompt.strip()
+    def get_prompt(self, text: str) -> str:
+        """
+        Get prompt for voice command recognition
+
+        :param text: text to be spoken
+        :return: prompt
+        """
+        return (self.get_prompt_prefix() + text).strip()
 
     def get_inline_prompt(self, prefix: str = None) -> str:
         """
@@ -180,31 +235,51 @@ class Voice:
         :param text: text
         :return: JSON
         """
-        json_pattern = r'(\{.*?\})'
         cmds = []
-        enabled_cmds = self.get_commands()
-        matches = re.findall(json_pattern, text, re.DOTALL)
-        if len(matches) > 0:
-            for match in matches:
-                try:
-                    data = json.loads(match)
-                    if "cmd" in data:
-                        cmd = data["cmd"]
-                        if cmd in enabled_cmds:
-                            item = {
-                                "cmd": cmd,
-                                "params": data.get("params", "")
-                            }
-                            cmds.append(item)
-                        else:
-                            cmds.append({
-                                "cmd": "unrecognized",
-                                "params": ""
-                            })
-                except Exception as e:
-                    self.window.core.debug.log(e)
+        if len(text) < 11 or '{' not in text:  # shorter than: {"cmd":"x"}
+            return cmds
+
+        # fast path: whole response is a single JSON object
+        stripped = text.strip()
+        if stripped[0] == '{' and stripped[-1] == '}':
+            try:
+                data = _json.loads(stripped)
+            except ValueError:
+                data = None
+            if isinstance(data, dict) and "cmd" in data:
+                cmds.append(self.prepare_cmd(data))
+                return cmds
+
+        for match in _iter_json_objects(text):
+            if '"cmd"' not in match:
+                continue  # not a command, skip parsing
+            try:
+                data = _json.loads(match)
+                if "cmd" in data:
+                    cmds.append(self.prepare_cmd(data))
+            except Exception as e:
+                if self.window.core.debug.enabled():
+                    self.window.core.debug.debug(e)
         return cmds
 
+    def prepare_cmd(self, data: dict) -> dict:
+        """
+        Prepare recognized command item from parsed JSON
+
+        :param data: parsed JSON data
+        :return: command item
+        """
+        cmd = data["cmd"]
+        if isinstance(cmd, str) and cmd in self._command_keys and not self.is_blacklisted(cmd):
+            return {
+                "cmd": cmd,
+                "params": data.get("params", "")
+            }
+        return {
+            "cmd": "unrecognized",
+            "params": ""
+        }
+
     def recognize_commands(self, text: str) -> list:
         """
         Recognize voice command
@@ -247,6 +322,17 @@ class Voice:
                 return True
         return False
 
+    def get_blacklist_key(self) -> tuple:
+        """
+        Get blacklisted voice control actions as hashable key
+
+        :return: tuple of blacklisted actions
+        """
+        data = self.window.core.config.get("access.voice_control.blacklist")
+        if data is None or not isinstance(data, list):
+            return ()
+        return tuple(item.get("disabled_action") for item in data if isinstance(item, dict))
+
     def is_blacklisted(self, action: str) -> bool:
         """
         Check if audio control action is blacklisted
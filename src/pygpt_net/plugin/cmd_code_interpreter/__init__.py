@@ -38,6 +38,7 @@ class Plugin(BasePlugin):
             "get_python_input",
             "clear_python_output",
         ]
+        self._allowed_cmds_set = frozenset(self.allowed_cmds)  # for fast membership tests
         self.use_locale = True
         self.init_options()
         self.runner = Runner(self)
@@ -217,12 +218,15 @@ class Plugin(BasePlugin):
         if self.get_option_value("sandbox_docker"):
             cwd = "/data (in docker sandbox)"
 
+        auto_cwd = self.get_option_value("auto_cwd")
+        sys_exec_suffix = "\nIMPORTANT: ALWAYS use absolute (not relative) path when passing " \
+                          "ANY command to \"command\" param, current working directory: {}".format(cwd)
+
         for item in self.allowed_cmds:
             if self.has_cmd(item):
                 cmd = self.get_cmd(item)
-                if self.get_option_value("auto_cwd") and item == "sys_exec":
-                    cmd["instruction"] += "\nIMPORTANT: ALWAYS use absolute (not relative) path when passing " \
-                                          "ANY command to \"command\" param, current working directory: {}".format(cwd)
+                if auto_cwd and item == "sys_exec":
+                    cmd["instruction"] += sys_exec_suffix
                 data['cmd'].append(cmd)  # append command
 
     @Slot(object, str)
@@ -252,7 +256,7 @@ class Plugin(BasePlugin):
         is_cmd = False
         my_commands = []
         for item in cmds:
-            if item["cmd"] in self.allowed_cmds:
+            if item["cmd"] in self._allowed_cmds_set:
                 my_commands.append(item)
                 is_cmd = True
 
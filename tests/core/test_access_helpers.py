@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.05.05 12:00:00                  #
+# ================================================== #
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from pygpt_net.item.ctx import CtxItem
+from tests.mocks import mock_window
+from pygpt_net.core.access.helpers import Helpers
+
+
+def test_convert_date(mock_window):
+    """Test convert date"""
+    helpers = Helpers(mock_window)
+    now = datetime.now()
+    with patch('pygpt_net.core.access.helpers.trans', side_effect=lambda key: key) as mock_trans:
+        assert helpers.convert_date(now.timestamp()) == "dt.today " + now.strftime("%H:%M")
+        assert helpers.convert_date((now - timedelta(days=10)).timestamp()) == "dt.week"
+        assert helpers.convert_date((now - timedelta(days=20)).timestamp()) == "2 dt.weeks"
+        assert helpers.convert_date((now - timedelta(days=100)).timestamp()) \
+               == (now - timedelta(days=100)).strftime("%Y-%m-%d")
+        assert mock_trans.call_count == 6  # labels are translated only once
+
+
+def test_get_tpl(mock_window):
+    """Test get template"""
+    helpers = Helpers(mock_window)
+    translations = {
+        "event.audio.tab.switch": "Tab: {tab}",
+        "event.audio.ctx.last": "{input} {missing}",  # invalid placeholder
+    }
+    with patch('pygpt_net.core.access.helpers.trans',
+               side_effect=lambda key: translations.get(key, key)) as mock_trans:
+        assert helpers.get_tpl("tab_switch") == "Tab: {tab}"
+        assert helpers.get_tpl("ctx_last") == ""
+        assert helpers.get_tpl("status") == "event.audio.app.status"
+        assert mock_trans.call_count == len(helpers.templates)  # translated only once
+
+
+def test_get_all_ctx_items(mock_window):
+    """Test get all ctx items"""
+    helpers = Helpers(mock_window)
+    helpers.get_tpl = lambda name: "{input}: {output}"
+    item1 = CtxItem()
+    item1.input = "a"
+    item1.output = "b"
+    item2 = CtxItem()
+    item2.input = "c"
+    item2.output = "d"
+    mock_window.core.ctx.get_all_items.return_value = [item1, item2]
+    assert helpers.get_all_ctx_items() == "a: b\nc: d"
+    assert list(helpers.iter_all_ctx_items()) == ["a: b", "c: d"]
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.05.05 12:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock, patch
+
+from tests.mocks import mock_window
+from pygpt_net.core.access.voice import Voice, _iter_json_objects
+
+
+def test_iter_json_objects():
+    """Test iter JSON objects"""
+    text = 'Sure: {"cmd": "a", "params": {"x": "}"}} and {"cmd": "b"} {unclosed'
+    assert list(_iter_json_objects(text)) == [
+        '{"cmd": "a", "params": {"x": "}"}}',
+        '{"cmd": "b"}',
+    ]
+
+
+def test_iter_json_objects_escaped_quote():
+    """Test iter JSON objects with escaped quote inside string"""
+    text = '{"cmd": "a", "params": "say \\"}\\" now"}'
+    assert list(_iter_json_objects(text)) == [text]
+
+
+def test_iter_json_objects_escaped_backslash():
+    """Test iter JSON objects with escaped backslash and other escapes inside string"""
+    text = '{"a": "x\\\\"} {"b": "\\n}"}'
+    assert list(_iter_json_objects(text)) == [
+        '{"a": "x\\\\"}',
+        '{"b": "\\n}"}',
+    ]
+
+
+def test_extract_json(mock_window):
+    """Test extract JSON"""
+    voice = Voice(mock_window)
+    text = 'Result: {"cmd": "app.status", "params": "test"} {"cmd": "foo"}'
+    assert voice.extract_json(text) == [
+        {"cmd": "app.status", "params": "test"},
+        {"cmd": "unrecognized", "params": ""},
+    ]
+
+
+def test_extract_json_nested(mock_window):
+    """Test extract JSON with nested params"""
+    voice = Voice(mock_window)
+    text = '{"cmd": "app.status", "params": {"a": 1}}'
+    assert voice.extract_json(text) == [
+        {"cmd": "app.status", "params": {"a": 1}},
+    ]
+
+
+def test_get_prompt(mock_window):
+    """Test get prompt"""
+    voice = Voice(mock_window)
+    voice.window.core.config.data["access.voice_control.blacklist"] = []
+    prompt = voice.get_prompt("go to the next tab")
+    assert prompt.startswith("Recognize the voice command")
+    assert prompt.endswith("go to the next tab")
+    assert "tab.next = Switch to the next tab" in prompt
+
+    # prefix is rebuilt on blacklist change
+    voice.window.core.config.data["access.voice_control.blacklist"] = [
+        {"disabled_action": "tab.next"},
+    ]
+    prompt = voice.get_prompt("go to the next tab")
+    assert "tab.next = Switch to the next tab" not in prompt
+
+
+def test_extract_json_no_json(mock_window):
+    """Test extract JSON from text without JSON"""
+    voice = Voice(mock_window)
+    voice.is_blacklisted = MagicMock()
+    assert voice.extract_json("I don't know what you mean.") == []
+    assert voice.extract_json("{}") == []
+    voice.is_blacklisted.assert_not_called()
+
+
+def test_extract_json_blacklisted(mock_window):
+    """Test extract JSON with blacklisted command"""
+    voice = Voice(mock_window)
+    voice.window.core.config.data["access.voice_control.blacklist"] = [
+        {"disabled_action": "app.status"},
+    ]
+    assert voice.extract_json('{"cmd": "app.status"}') == [
+        {"cmd": "unrecognized", "params": ""},
+    ]
+
+
+def test_extract_json_single_object(mock_window):
+    """Test extract JSON when whole response is a single object"""
+    voice = Voice(mock_window)
+    with patch('pygpt_net.core.access.voice._iter_json_objects') as mock_iter:
+        assert voice.extract_json(' {"cmd": "app.status", "params": ""}\n') == [
+            {"cmd": "app.status", "params": ""},
+        ]
+        mock_iter.assert_not_called()
+
+
+def test_get_commands(mock_window):
+    """Test get commands"""
+    voice = Voice(mock_window)
+    voice.window.core.config.data["access.voice_control.blacklist"] = [
+        {"disabled_action": "app.status"},
+        {"disabled_action": "app.exit"},
+    ]
+    cmds = voice.get_commands()
+    assert "app.status" not in cmds
+    assert "app.exit" not in cmds
+    assert len(cmds) == len(voice.commands) - 2